@@ -217,6 +217,9 @@ class RayAccelerator(DDPSpawnAccelerator):
         # Then we can just return those attributes here.
         super(RayAccelerator, self).ddp_train(
             process_idx=global_rank, mp_queue=None, model=model)
+        if global_rank != 0:
+            # Only want results from the first worker.
+            return None
         return self.results, self.best_model_path, self.model_state_dict
 
     def init_ddp_connection(self,
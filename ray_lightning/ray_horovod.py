@@ -5,7 +5,7 @@ from pytorch_lightning.accelerators.horovod_accelerator import \
 from ray import ObjectRef
 
 from ray_lightning.session import init_session
-from ray_lightning.util import process_results, Queue, Unavailable
+from ray_lightning.util import process_results, to_cpu, Queue, Unavailable
 from ray_lightning.tune import TUNE_INSTALLED, is_session_enabled
 
 try:
@@ -29,10 +29,15 @@ if HOROVOD_AVAILABLE:
         def run_async(self, fn, args=None, kwargs=None):
             args = args or []
             kwargs = kwargs or {}
-            return [
-                worker.execute.remote(lambda w: fn(*args, **kwargs))
-                for worker in self.workers
-            ]
+            # Serialize the function and its arguments only once, instead
+            # of once per worker.
+            fn_ref = ray.put((fn, args, kwargs))
+
+            def _apply(w, ref=fn_ref):
+                f, a, kw = ray.get(ref)
+                return f(*a, **kw)
+
+            return [worker.execute.remote(_apply) for worker in self.workers]
 else:
     CustomRayExecutor = Unavailable
 
@@ -90,26 +95,37 @@ class HorovodRayAccelerator(HorovodAccelerator):
         self.num_hosts = num_hosts
         self.num_slots = num_slots
         self.use_gpu = use_gpu
+        self.executor = None
+        if HOROVOD_AVAILABLE:
+            self._create_executor()
+
+    # Attributes pickled in addition to the ones of HorovodAccelerator.
+    _pickle_extras = ("num_hosts", "num_slots", "use_gpu")
 
     def __getstate__(self):
         d = super(HorovodRayAccelerator, self).__getstate__()
-        d["num_hosts"] = self.num_hosts
-        d["num_slots"] = self.num_slots
-        d["use_gpu"] = self.use_gpu
+        d.update((k, getattr(self, k)) for k in self._pickle_extras)
         return d
 
     def __setstate__(self, d):
         self.__dict__.update(d)
 
-    def setup(self, model: LightningModule):
-        """Sets up the trainer and creates the RayExecutor object."""
-        self.trainer.use_horovod = True
+    def _create_executor(self):
+        """Creates the RayExecutor object."""
         settings = CustomRayExecutor.create_settings(timeout_s=30)
         self.executor = CustomRayExecutor(
             settings,
             num_hosts=self.num_hosts,
             num_slots=self.num_slots,
             use_gpu=self.use_gpu)
+
+    def setup(self, model: LightningModule):
+        """Sets up the trainer and starts the RayExecutor workers."""
+        self.trainer.use_horovod = True
+        if getattr(self, "executor", None) is None:
+            # The executor is not pickled, e.g. when this accelerator is
+            # sent to a Ray Tune trial, so create it again.
+            self._create_executor()
         self.trainer.model = model
         self.executor.start(executable_cls=get_executable_cls())
 
@@ -121,7 +137,11 @@ class HorovodRayAccelerator(HorovodAccelerator):
         revieve intermediate results, and process those results. Finally
         retrieve the training results from the rank 0 worker and return."""
         trainer = self.trainer
+        # Put the trainer in the object store once. Only the ObjectRef is
+        # sent to the workers, which each read the trainer from the shared
+        # memory object store in ``train_remote``.
         trainer_ref = ray.put(self.trainer)
+        # Don't pickle self.trainer when training remotely.
         self.trainer = None
 
         queue = None
@@ -144,20 +164,27 @@ class HorovodRayAccelerator(HorovodAccelerator):
         return results
 
     def train_remote(self, trainer_ref: ObjectRef, queue: Queue = None):
-        """Training function to be executed on each remote worker."""
+        """Training function to be executed on each remote worker.
+
+        ``trainer_ref`` must be the ObjectRef of the trainer, not the trainer
+        itself, so it is resolved from the object store on each worker
+        instead of being pickled along with this function."""
+        assert isinstance(trainer_ref, ObjectRef)
         self.trainer = ray.get(trainer_ref)
         hvd.init()
+        rank = hvd.rank()
+        local_rank = hvd.local_rank()
         if queue is not None:
             # Initialize session.
-            init_session(rank=hvd.rank(), queue=queue)
+            init_session(rank=rank, queue=queue)
         if self.trainer.on_gpu:
             # Horovod assigns one local GPU per process.
-            self.trainer.root_gpu = hvd.local_rank()
+            self.trainer.root_gpu = local_rank
 
         # TODO: Make changes in PTL to clean this up.
         super(HorovodRayAccelerator, self).setup(self.trainer.model)
         results = super(HorovodRayAccelerator, self).train()
-        if hvd.rank() != 0:
+        if rank != 0:
             # Only want results from the first worker.
             return None
 
@@ -166,7 +193,9 @@ class HorovodRayAccelerator(HorovodAccelerator):
             best_model_path = self.trainer.checkpoint_callback.best_model_path
 
         model = self.trainer.model
-        return results, model.state_dict(), best_model_path
+        # Results may contain GPU tensors, which the driver might not be
+        # able to load.
+        return to_cpu(results), to_cpu(model.state_dict()), best_model_path
 
     def teardown(self):
         """Shuts down the RayExecutor."""
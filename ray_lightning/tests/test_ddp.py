@@ -1,3 +1,5 @@
+import time
+
 import pytest
 from torch.utils.data import DistributedSampler
 
@@ -12,6 +14,7 @@ from ray.tune.examples.mnist_ptl_mini import LightningMNISTClassifier
 from ray_lightning import RayAccelerator
 from ray_lightning.tests.utils import get_trainer, train_test, \
     load_test, predict_test, BoringModel
+from ray_lightning.util import process_results
 
 
 @pytest.fixture
@@ -132,3 +135,21 @@ def test_early_stop(tmpdir, ray_start_2_cpus):
     trained_model = BoringModel.load_from_checkpoint(
         trainer.checkpoint_callback.best_model_path)
     assert trained_model.val_epoch == 2, trained_model.val_epoch
+
+
+def test_process_results_order(ray_start_2_cpus):
+    """Tests if results are returned in the order of the futures."""
+
+    @ray.remote
+    def train_remote(rank, delay):
+        time.sleep(delay)
+        # Only the first worker returns results.
+        return "rank_0" if rank == 0 else None
+
+    # Rank 0 finishes last.
+    futures = [
+        train_remote.remote(0, 2),
+        train_remote.remote(1, 0),
+        train_remote.remote(2, 0)
+    ]
+    assert process_results(futures, None) == ["rank_0", None, None]
@@ -1,16 +1,23 @@
 import os
+import time
+
 import pytest
+import torch
 
 import ray
 from ray import tune
 
+import ray_lightning.session
 from ray_lightning import RayAccelerator, HorovodRayAccelerator
+from ray_lightning.session import init_session
 from ray_lightning.tests.utils import BoringModel, get_trainer
-from ray_lightning.tune import TuneReportCallback, TuneReportCheckpointCallback
+from ray_lightning.tune import TuneReportCallback, \
+    TuneReportCheckpointCallback, _TuneCheckpointCallback, _to_python_scalars
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def ray_start_4_cpus():
+    # Ray is started once and shared by all tests in this module.
     address_info = ray.init(num_cpus=4)
     yield address_info
     ray.shutdown()
@@ -86,3 +93,119 @@ def test_checkpoint_horovod(tmpdir, ray_start_4_cpus):
     accelerator = HorovodRayAccelerator(
         num_hosts=1, num_slots=2, use_gpu=False)
     checkpoint_test(tmpdir, accelerator)
+
+
+class _CountingReportCallback(TuneReportCallback):
+    """Reports a running count, to check that no report is lost."""
+
+    def __init__(self, *args, **kwargs):
+        super(_CountingReportCallback, self).__init__(*args, **kwargs)
+        self._count = 0
+
+    def _get_report_dict(self, trainer, pl_module):
+        self._count += 1
+        return {"report_index": self._count}
+
+
+def test_tune_report_batch_end(tmpdir, ray_start_4_cpus):
+    """Tests if all buffered per batch reports reach Tune, in order."""
+    accelerator = RayAccelerator(num_workers=2, use_gpu=False)
+    callbacks = [_CountingReportCallback(on="batch_end")]
+    analysis = tune.run(
+        train_func(tmpdir, accelerator, callbacks=callbacks),
+        config={"max_epochs": 2},
+        resources_per_trial={
+            "cpu": 0,
+            "extra_cpu": 2
+        },
+        num_samples=1)
+    trial_df = list(analysis.trial_dataframes.values())[0]
+    # One report per training batch: 2 epochs of 10 batches each.
+    num_reports = 2 * 10
+    assert list(trial_df["report_index"]) == list(range(1, num_reports + 1))
+
+
+class _ListQueue:
+    """Records the items put in the session queue."""
+
+    def __init__(self):
+        self.items = []
+
+    def put(self, item):
+        self.items.append(item)
+
+    def reports(self):
+        return [r["report_index"] for _, batch in self.items for r in batch]
+
+
+@pytest.fixture
+def report_queue():
+    queue = _ListQueue()
+    init_session(rank=0, queue=queue)
+    yield queue
+    ray_lightning.session._session = None
+
+
+class _Trainer:
+    running_sanity_check = False
+
+
+def test_tune_report_buffer_flush(report_queue):
+    """Tests when buffered per batch reports are sent to the driver."""
+    trainer = _Trainer()
+    callback = _CountingReportCallback(on="batch_end")
+    callback._last_flush = time.time()
+    callback._handle(trainer, None)
+    callback._handle(trainer, None)
+    # Fast reports are buffered.
+    assert report_queue.reports() == []
+    # The buffer is flushed at the end of the epoch.
+    callback.on_epoch_end(trainer, None)
+    assert report_queue.reports() == [1, 2]
+    callback._handle(trainer, None)
+    assert report_queue.reports() == [1, 2]
+    # A report after a long gap is sent right away, with the buffered one.
+    callback._last_flush -= 1
+    callback._handle(trainer, None)
+    assert report_queue.reports() == [1, 2, 3, 4]
+
+
+def test_tune_report_epoch_hook_not_buffered(report_queue):
+    """Tests if reports from epoch level hooks are sent right away."""
+    trainer = _Trainer()
+    callback = _CountingReportCallback(on="validation_end")
+    callback._last_flush = time.time()
+    callback._handle(trainer, None)
+    callback._handle(trainer, None)
+    assert report_queue.reports() == [1, 2]
+
+
+def test_to_python_scalars():
+    """Tests if metric values are converted to the right Python scalars."""
+    values = [
+        torch.tensor(1.5),
+        torch.tensor(3),
+        torch.tensor([2.5]),
+        torch.tensor(7),
+        torch.tensor(0.5, dtype=torch.float64),
+        4.0,
+    ]
+    scalars = _to_python_scalars(values)
+    assert scalars == [1.5, 3, 2.5, 7, 0.5, 4.0]
+    # Integer tensors must stay ints.
+    assert [type(s) for s in scalars] == [float, int, float, int, float, float]
+
+
+def test_checkpoint_thread_failure():
+    """Tests if checkpoint errors are raised and stop later reports."""
+    callback = _TuneCheckpointCallback()
+    reports = []
+
+    def save_checkpoint():
+        raise RuntimeError("checkpoint failed")
+
+    callback._submit(save_checkpoint)
+    callback._submit(reports.append, {"loss": 1.0})
+    with pytest.raises(RuntimeError, match="checkpoint failed"):
+        callback._close()
+    assert reports == []
@@ -26,19 +26,30 @@ class BoringModel(LightningModule):
         super().__init__()
         self.layer = torch.nn.Linear(32, 2)
         self.val_epoch = 0
+        # Constant tensors, created once instead of on every step.
+        self._one = torch.tensor(1.0)
+        self._ones_cache = {}
 
     def forward(self, x):
         return self.layer(x)
 
+    def _ones_like(self, x):
+        key = (x.shape, x.dtype, x.device)
+        ones = self._ones_cache.get(key)
+        if ones is None:
+            ones = torch.ones_like(x)
+            self._ones_cache[key] = ones
+        return ones
+
     def loss(self, batch, prediction):
         # Arbitrary loss to have a loss that updates the model weights
         # during `Trainer.fit` calls
         return torch.nn.functional.mse_loss(prediction,
-                                            torch.ones_like(prediction))
+                                            self._ones_like(prediction))
 
     def step(self, x):
         x = self(x)
-        out = torch.nn.functional.mse_loss(x, torch.ones_like(x))
+        out = torch.nn.functional.mse_loss(x, self._ones_like(x))
         return out
 
     def training_step(self, batch, batch_idx):
@@ -50,16 +61,15 @@ class BoringModel(LightningModule):
         return training_step_outputs
 
     def training_epoch_end(self, outputs) -> None:
-        torch.stack([x["loss"] for x in outputs]).mean()
+        pass
 
     def validation_step(self, batch, batch_idx):
         self.layer(batch)
-        loss = torch.tensor(1.0)
+        loss = self._one
         self.log("val_loss", loss)
         return {"x": loss}
 
     def validation_epoch_end(self, outputs) -> None:
-        torch.stack([x["x"] for x in outputs]).mean()
         self.val_epoch += 1
 
     def test_step(self, batch, batch_idx):
@@ -68,7 +78,7 @@ class BoringModel(LightningModule):
         return {"y": loss}
 
     def test_epoch_end(self, outputs) -> None:
-        torch.stack([x["y"] for x in outputs]).mean()
+        pass
 
     def configure_optimizers(self):
         optimizer = torch.optim.SGD(self.layer.parameters(), lr=0.1)
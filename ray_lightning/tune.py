@@ -1,11 +1,16 @@
-from typing import Dict, List, Union
+from typing import Callable, Dict, List, Optional, Union
 
+import io
 import os
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
-from pytorch_lightning.utilities.cloud_io import atomic_save
+import torch
 from pytorch_lightning import Trainer, LightningModule
 
 from ray_lightning.session import put_queue, get_actor_rank
+from ray_lightning.util import to_cpu
 
 try:
     from ray import tune
@@ -21,6 +26,29 @@ except ImportError:
 
     TUNE_INSTALLED = False
 
+
+def _to_python_scalars(values: List) -> List:
+    """Converts single element tensors to Python scalars.
+
+    Tensors are stacked per device and dtype and copied to the host
+    together, so each device is synchronized once instead of once per
+    ``.item()`` call."""
+    scalars = list(values)
+    groups = defaultdict(list)
+    for i, value in enumerate(values):
+        if isinstance(value, torch.Tensor):
+            groups[(value.device, value.dtype)].append(i)
+    group_indices = list(groups.values())
+    stacked = to_cpu([
+        torch.stack([values[i].detach().reshape(()) for i in indices])
+        for indices in group_indices
+    ])
+    for indices, group in zip(group_indices, stacked):
+        for i, scalar in zip(indices, group.tolist()):
+            scalars[i] = scalar
+    return scalars
+
+
 if TUNE_INSTALLED:
 
     class TuneReportCallback(TuneCallback):
@@ -65,6 +93,9 @@ if TUNE_INSTALLED:
 
             """
 
+        _max_buffer_size = 16
+        _max_buffer_time_s = 0.05
+
         def __init__(
                 self,
                 metrics: Union[None, str, List[str], Dict[str, str]] = None,
@@ -73,6 +104,12 @@ if TUNE_INSTALLED:
             if isinstance(metrics, str):
                 metrics = [metrics]
             self._metrics = metrics
+            # Reports from per batch hooks are buffered and sent to the
+            # driver in batches, to avoid one queue call per report.
+            # Reports from any other hook are sent right away.
+            self._buffer_reports = all("batch" in hook for hook in self._on)
+            self._buffer = deque()
+            self._last_flush = time.time()
 
         def _get_report_dict(self, trainer: Trainer,
                              pl_module: LightningModule):
@@ -80,25 +117,54 @@ if TUNE_INSTALLED:
             if trainer.running_sanity_check:
                 return
             if not self._metrics:
-                report_dict = {
-                    k: v.item()
-                    for k, v in trainer.callback_metrics.items()
-                }
+                keys = list(trainer.callback_metrics)
+                metrics = keys
+            elif isinstance(self._metrics, dict):
+                keys = list(self._metrics)
+                metrics = [self._metrics[key] for key in keys]
             else:
-                report_dict = {}
-                for key in self._metrics:
-                    if isinstance(self._metrics, dict):
-                        metric = self._metrics[key]
-                    else:
-                        metric = key
-                    report_dict[key] = trainer.callback_metrics[metric].item()
-            return report_dict
+                keys = self._metrics
+                metrics = keys
+            values = _to_python_scalars(
+                [trainer.callback_metrics[metric] for metric in metrics])
+            return dict(zip(keys, values))
 
         def _handle(self, trainer: Trainer, pl_module: LightningModule):
             if get_actor_rank() == 0:
                 report_dict = self._get_report_dict(trainer, pl_module)
                 if report_dict is not None:
-                    put_queue(lambda: tune.report(**report_dict))
+                    self._buffer.append(report_dict)
+                    if not self._buffer_reports or \
+                            len(self._buffer) >= self._max_buffer_size or \
+                            time.time() - self._last_flush > \
+                            self._max_buffer_time_s:
+                        self._flush()
+
+        def _flush(self):
+            """Sends all buffered reports to the driver."""
+            if self._buffer:
+                # Send plain dicts, they are reported to Tune on the driver.
+                # This avoids pickling a closure per report.
+                put_queue(list(self._buffer))
+                self._buffer.clear()
+            self._last_flush = time.time()
+
+        # Buffered reports are also sent at the end of each epoch and
+        # before validation, so Tune doesn't act on stale results.
+        def on_epoch_end(self, trainer: Trainer, pl_module: LightningModule):
+            super(TuneReportCallback, self).on_epoch_end(trainer, pl_module)
+            self._flush()
+
+        def on_validation_start(self, trainer: Trainer,
+                                pl_module: LightningModule):
+            super(TuneReportCallback, self).on_validation_start(
+                trainer, pl_module)
+            self._flush()
+
+        def on_train_end(self, trainer: Trainer, pl_module: LightningModule):
+            super(TuneReportCallback, self).on_train_end(trainer, pl_module)
+            # Make sure no reports are left behind.
+            self._flush()
 
     class _TuneCheckpointCallback(TuneCallback):
         """Distributed PyTorch Lightning to Ray Tune checkpoint callback
@@ -124,13 +190,64 @@ if TUNE_INSTALLED:
                      on: Union[str, List[str]] = "validation_end"):
             super(_TuneCheckpointCallback, self).__init__(on)
             self._filename = filename
+            # Checkpoints are serialized on a background thread, so
+            # training can continue in the meantime.
+            self._executor = None
+            self._futures = deque()
+
+        def __getstate__(self):
+            d = self.__dict__.copy()
+            d["_executor"] = None
+            d["_futures"] = deque()
+            return d
 
         @staticmethod
-        def _create_checkpoint(checkpoint_dict: dict, global_step: int,
+        def _create_checkpoint(checkpoint_bytes: bytes, global_step: int,
                                filename: str):
             with tune.checkpoint_dir(step=global_step) as checkpoint_dir:
                 file_path = os.path.join(checkpoint_dir, filename)
-                atomic_save(checkpoint_dict, file_path)
+                # Write to a temporary file first, so a partially written
+                # checkpoint never shows up under the final name.
+                tmp_path = file_path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(checkpoint_bytes)
+                os.replace(tmp_path, file_path)
+
+        @staticmethod
+        def _save_checkpoint(checkpoint_dict: dict, global_step: int,
+                             filename: str):
+            """Serializes the checkpoint and sends it to the driver."""
+            buffer = io.BytesIO()
+            torch.save(checkpoint_dict, buffer)
+            checkpoint_bytes = buffer.getvalue()
+            put_queue(lambda: _TuneCheckpointCallback._create_checkpoint(
+                checkpoint_bytes, global_step, filename))
+
+        @staticmethod
+        def _run_after(previous: Optional[Future], fn: Callable, *args):
+            if previous is not None:
+                # Raises if the previous function failed. This way e.g. a
+                # report is not sent for a checkpoint that was not saved.
+                previous.result()
+            return fn(*args)
+
+        def _submit(self, fn: Callable, *args):
+            """Runs ``fn`` on the background thread.
+
+            Submitted functions are run in order, one at a time. If one
+            fails, the functions submitted after it are not run."""
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            previous = self._futures[-1] if self._futures else None
+            self._futures.append(
+                self._executor.submit(self._run_after, previous, fn, *args))
+
+        def _wait(self):
+            """Waits for all submitted functions to finish.
+
+            Raises the first error raised by any of them."""
+            while self._futures:
+                self._futures.popleft().result()
 
         def _handle(self, trainer: Trainer, pl_module: LightningModule):
             if trainer.running_sanity_check:
@@ -138,8 +255,27 @@ if TUNE_INSTALLED:
             checkpoint_dict = trainer.checkpoint_connector.dump_checkpoint()
             global_step = trainer.global_step
             if get_actor_rank() == 0:
-                put_queue(lambda: self._create_checkpoint(
-                    checkpoint_dict, global_step, self._filename))
+                # Only keep one checkpoint in flight at a time.
+                self._wait()
+                self._submit(self._save_checkpoint,
+                             to_cpu(checkpoint_dict, copy=True), global_step,
+                             self._filename)
+
+        def _close(self):
+            """Waits for all submitted functions and stops the thread."""
+            try:
+                self._wait()
+            finally:
+                self._futures.clear()
+                if self._executor is not None:
+                    self._executor.shutdown()
+                    self._executor = None
+
+        def on_train_end(self, trainer: Trainer, pl_module: LightningModule):
+            super(_TuneCheckpointCallback, self).on_train_end(
+                trainer, pl_module)
+            # Make sure all checkpoints are sent before training returns.
+            self._close()
 
     class TuneReportCheckpointCallback(TuneCallback):
         """PyTorch Lightning to Tune reporting and checkpointing callback.
@@ -196,4 +332,17 @@ if TUNE_INSTALLED:
 
         def _handle(self, trainer: Trainer, pl_module: LightningModule):
             self._checkpoint._handle(trainer, pl_module)
-            self._report._handle(trainer, pl_module)
+            if get_actor_rank() == 0:
+                report_dict = self._report._get_report_dict(trainer, pl_module)
+                if report_dict is not None:
+                    # Checkpoints are registered with the next report, so
+                    # send the report from the checkpoint thread, after the
+                    # checkpoint has been sent.
+                    self._checkpoint._submit(put_queue, [report_dict])
+
+        def on_train_end(self, trainer: Trainer, pl_module: LightningModule):
+            super(TuneReportCheckpointCallback, self).on_train_end(
+                trainer, pl_module)
+            # Make sure all checkpoints and reports are sent before training
+            # returns.
+            self._checkpoint._close()
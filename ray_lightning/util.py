@@ -1,8 +1,10 @@
 # Remove after Ray 1.2 release.
 import asyncio
+import copy
 from typing import Optional, Dict, Callable
 
 import ray
+import torch
 from ray.util.queue import Queue as RayQueue, Empty, Full
 
 
@@ -85,25 +87,81 @@ class Queue(RayQueue):
             self.actor = None
 
 
+def _copy_to_host(obj, cuda_devices: set, clone: bool):
+    """Recursively replaces GPU tensors in ``obj`` with pinned host copies.
+
+    The copies are non-blocking. Devices that need to be synchronized
+    before the copies can be read are added to ``cuda_devices``. If
+    ``clone`` is set, CPU tensors are copied as well."""
+    if isinstance(obj, torch.Tensor):
+        if not obj.is_cuda:
+            return obj.detach().clone() if clone else obj
+        buffer = torch.empty(obj.size(), dtype=obj.dtype, pin_memory=True)
+        buffer.copy_(obj.detach(), non_blocking=True)
+        cuda_devices.add(obj.device)
+        return buffer
+    if isinstance(obj, dict):
+        # ``copy.copy`` keeps attributes like the state dict ``_metadata``.
+        copied = copy.copy(obj)
+        for key, value in obj.items():
+            copied[key] = _copy_to_host(value, cuda_devices, clone)
+        return copied
+    if type(obj) in (list, tuple):
+        return type(obj)(
+            _copy_to_host(value, cuda_devices, clone) for value in obj)
+    return obj
+
+
+def to_cpu(obj, copy: bool = False):
+    """Copies all GPU tensors in ``obj`` to host memory.
+
+    ``obj`` can be a tensor, or nested dicts, lists and tuples of them,
+    such as a state dict or training results. GPU tensors are copied
+    asynchronously into pinned host buffers, and each device is
+    synchronized once after all copies have been issued.
+
+    If ``copy`` is set, CPU tensors are copied too, so the result is a
+    snapshot that is not changed by later updates to ``obj``."""
+    cuda_devices = set()
+    obj = _copy_to_host(obj, cuda_devices, clone=copy)
+    for device in cuda_devices:
+        torch.cuda.synchronize(device)
+    return obj
+
+
 def _handle_queue(queue):
     """Process results from the queue."""
     while not queue.empty():
         (actor_rank, item) = queue.get()
         if isinstance(item, Callable):
             item()
+        elif isinstance(item, list):
+            # Batch of metrics reported by ``TuneReportCallback``. Tune is
+            # installed if a queue is used.
+            from ray import tune
+            for report_dict in item:
+                tune.report(**report_dict)
 
 
 def process_results(training_result_futures, queue):
-    """Process results from the queue, and return results from the futures."""
-    not_ready = training_result_futures
+    """Process results from the queue, and return results from the futures.
+
+    Each future is fetched once, as soon as it is ready, so worker errors
+    are raised early. Results are returned in the order of the futures."""
+    results = [None] * len(training_result_futures)
+    future_index = {
+        future: i
+        for i, future in enumerate(training_result_futures)
+    }
+    not_ready = list(training_result_futures)
     while not_ready:
         if queue:
             _handle_queue(queue)
         ready, not_ready = ray.wait(not_ready, timeout=0)
-        ray.get(ready)
-    ray.get(ready)
+        for future in ready:
+            results[future_index[future]] = ray.get(future)
 
     if queue:
         # Process any remaining items in queue.
         _handle_queue(queue)
-    return ray.get(training_result_futures)
+    return results